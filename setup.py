@@ -29,6 +29,10 @@ redis = [
     'aioredis>=0.3.0, <0.4',
 ]
 
+msgpack = [
+    'msgpack>=0.5.2',
+]
+
 
 setup(
     name='zentropi',
@@ -81,7 +85,6 @@ setup(
         'fuzzywuzzy>=0.15.0, <0.20',
         'parse>=1.8.0, <2.0',
         'prompt_toolkit>=1.0.14, <1.1',
-        'pybloom_live>=2.2.0, <2.3',
         'Pygments>=2.2.0, <2.3',
         'python-Levenshtein>=0.12.0',
         'sortedcontainers>=1.5.7, <1.6',
@@ -90,6 +93,7 @@ setup(
     ],
     extras_require={
         'redis': redis,
+        'msgpack': msgpack,
     },
     entry_points={
         'console_scripts': [
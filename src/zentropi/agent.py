@@ -4,13 +4,16 @@ import asyncio
 import signal
 import threading
 import traceback
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
 from inspect import isgeneratorfunction
 from typing import Optional, Union
 
-from pybloom_live import ScalableBloomFilter
-
+from zentropi.dedup import RecentFrameIds
+from zentropi.defaults import HANDLER_EXECUTOR_PROCESSES, HANDLER_EXECUTOR_THREADS
 from zentropi.frames import Event, Frame, Message
-from zentropi.handlers import Handler
+from zentropi.handlers import EXECUTOR_PROCESS, Handler
+from zentropi.pool import HandlerPool
 from zentropi.symbols import KINDS
 from zentropi.timer import TimerRegistry
 from zentropi.utils import logger
@@ -40,7 +43,9 @@ class Agent(Zentropian):
     None
     """
 
-    def __init__(self, name=None, auth=None):
+    def __init__(self, name=None, auth=None, dedup=None, handler_pool=None,
+                 executor_threads=HANDLER_EXECUTOR_THREADS,
+                 executor_processes=HANDLER_EXECUTOR_PROCESSES):
         """
         >>> from zentropi import Agent
         >>>
@@ -51,32 +56,82 @@ class Agent(Zentropian):
 
         :param name: Name of Agent. Unicode string. Length must be < FRAME_NAME_MAX_LENGTH (default: 128) characters.
         :type name: str
+        :param dedup: Remembers seen frame ids, see zentropi.dedup. Default: RecentFrameIds()
+        :type dedup: zentropi.dedup.FrameDeduplicator
+        :param handler_pool: Runs async handlers with bounded concurrency, see zentropi.pool.
+                             Default: None, every async handler is spawned right away.
+        :type handler_pool: zentropi.pool.HandlerPool
+        :param executor_threads: Size of the thread pool for handlers with executor='thread'.
+        :type executor_threads: int
+        :param executor_processes: Size of the process pool for handlers with executor='process'.
+                                   Default: None, one process per CPU.
+        :type executor_processes: int
         """
         self.timers = TimerRegistry(callback=self._trigger_frame_handler)
         super().__init__(name=name, auth=auth)
         self.states.should_stop = False
         self.states.running = False
         self.loop = None  # asyncio.get_event_loop()
+        self._stop_event = None  # type: Optional[asyncio.Event]
         self._spawn_on_start = set()
-        self._seen_frames = ScalableBloomFilter(
-                    mode=ScalableBloomFilter.LARGE_SET_GROWTH, error_rate=0.001)
+        self._seen_frames = dedup if dedup is not None else RecentFrameIds()
+        self.handler_pool = handler_pool  # type: Optional[HandlerPool]
+        if handler_pool is not None:
+            handler_pool.bind(self.spawn)
+        self._executor_workers = {'thread': executor_threads, 'process': executor_processes}
+        self._executors = {}  # type: dict
 
     @on_state('should_stop')
     def _on_should_stop(self, state):
         if state.data.last is False and state.data.value is True:  # skip double close
             self.close()
+            self._wake_run_loop()
         return True
 
+    def _wake_run_loop(self):
+        """Wake up _run_forever(), safe to call from other threads."""
+        if self._stop_event is None or self.loop is None or self.loop.is_closed():
+            return
+        self.loop.call_soon_threadsafe(self._stop_event.set)
+
     async def _run_forever(self):
         # atexit.register(self.loop.close)
         if self._spawn_on_start:
             [self.spawn(coro) for coro in self._spawn_on_start]
             self._spawn_on_start = None
+        self._stop_event = asyncio.Event()
         self.emit('*** start', internal=True)
         self.timers.start_timers(self.spawn)
         while self.states.should_stop is False:
-            await asyncio.sleep(1)
+            await self._stop_event.wait()
+            self._stop_event.clear()
         self.emit('*** stopped', internal=True)
+        self._shutdown_executors()
+
+    def _get_executor(self, kind):
+        """Thread and process pools are created on first use and shared by all handlers."""
+        executor = self._executors.get(kind, None)
+        if executor is None:
+            if kind == EXECUTOR_PROCESS:
+                executor = ProcessPoolExecutor(max_workers=self._executor_workers[kind])
+            else:
+                executor = ThreadPoolExecutor(max_workers=self._executor_workers[kind],
+                                              thread_name_prefix='{}-handler'.format(self.name))
+            self._executors[kind] = executor
+        return executor
+
+    def _shutdown_executors(self):
+        executors, self._executors = self._executors, {}
+        for executor in executors.values():
+            executor.shutdown(wait=False)
+
+    def _run_in_executor(self, handler: Handler, payload: list):
+        executor = self._get_executor(handler.executor)
+        if handler.executor == EXECUTOR_PROCESS:
+            func = partial(handler.func, *payload)  # picklable, unlike the Handler wrapper.
+        else:
+            func = partial(handler, *payload)
+        return self.loop.run_in_executor(executor, func)
 
     def _set_asyncio_loop(self, loop=None):
         if self.loop and loop:
@@ -105,10 +160,13 @@ class Agent(Zentropian):
             payload.append(self)
         if handler.kind != KINDS.TIMER:
             payload.append(frame)
-        if handler.run_async:
+        if handler.run_async or handler.executor:
             async def return_handler():
                 try:
-                    ret_val = await handler(*payload)
+                    if handler.executor:
+                        ret_val = await self._run_in_executor(handler, payload)
+                    else:
+                        ret_val = await handler(*payload)
                     if ret_val:
                         self.handle_return(frame, return_value=ret_val)
                 except Exception as e:
@@ -117,7 +175,10 @@ class Agent(Zentropian):
                     traceback.print_exc()
                     signal.alarm(1)
                     self.stop()
-            self.spawn(return_handler())
+            if self.handler_pool is None:
+                self.spawn(return_handler())
+            else:
+                self.handler_pool.submit(return_handler)
         else:
             ret_val = handler(*payload)
             if ret_val:
@@ -171,14 +232,14 @@ class Agent(Zentropian):
         self.states.should_stop = True
         self.timers.should_stop = True
 
-    def connect(self, endpoint, *, auth=None, tag='default'):
-        retval = super().connect(endpoint, auth=auth, tag=tag)
+    def connect(self, endpoint, *, auth=None, tag='default', **options):
+        retval = super().connect(endpoint, auth=auth, tag=tag, **options)
         if not isgeneratorfunction(retval):
             return
         self.spawn(retval)
 
-    def bind(self, endpoint, *, tag='default'):
-        retval = super().bind(endpoint, tag=tag)
+    def bind(self, endpoint, *, tag='default', **options):
+        retval = super().bind(endpoint, tag=tag, **options)
         if not isgeneratorfunction(retval):
             return
         self.spawn(retval)
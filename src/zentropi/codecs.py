@@ -0,0 +1,151 @@
+# coding=utf-8
+import json
+import struct
+from typing import Optional, Union
+
+from zentropi.frames import Frame
+from zentropi.ids import ID_BYTES, id_from_bytes, id_to_bytes
+
+
+class Codec(object):
+    """
+    Encodes frames to a wire payload and back.
+
+    Transports pick a codec per connection, for example:
+
+        >>> agent.connect('redis://127.0.0.1:6379', codec='msgpack')  # doctest: +SKIP
+
+    Frame.encode() caches the payload per codec name, so a frame
+    fanned out over many spaces or connections is encoded once.
+    """
+    name = None  # type: Optional[str]
+    binary = False
+
+    def encode(self, frame: Frame) -> Union[str, bytes]:
+        raise NotImplementedError()
+
+    def decode(self, payload: Union[str, bytes], *,
+               source: Optional[str] = None,
+               trusted: bool = False) -> Frame:
+        raise NotImplementedError()
+
+
+class JsonCodec(Codec):
+    name = 'json'
+    binary = False
+
+    def encode(self, frame: Frame) -> str:
+        return json.dumps(frame.as_dict())
+
+    def decode(self, payload: Union[str, bytes], *,
+               source: Optional[str] = None,
+               trusted: bool = False) -> Frame:
+        if isinstance(payload, bytes):
+            payload = payload.decode('utf-8')
+        return Frame.from_json(payload, source=source, trusted=trusted)
+
+
+class MsgpackCodec(Codec):
+    """
+    Compact binary codec.
+
+    A fixed struct header carries flags, kind and timestamp, followed
+    by the 16 byte form of the frame id (see zentropi.ids) when it has
+    one. The rest of the frame is a msgpack array, with the well
+    known meta keys stored by position instead of by name.
+    """
+    name = 'msgpack'
+    binary = True
+
+    HEADER = struct.Struct('>Bbq')  # flags, kind, timestamp
+    FLAG_BINARY_ID = 0x01
+    FLAG_TIMESTAMP = 0x02
+    FLAG_INTERNAL = 0x04
+    META_KEYS = ('source', 'target', 'space', 'reply_to')
+
+    def __init__(self) -> None:
+        try:
+            import msgpack
+        except ImportError:
+            raise ImportError('Missing dependency: pip install msgpack')
+        self._msgpack = msgpack
+
+    def encode(self, frame: Frame) -> bytes:
+        frame_as_dict = frame.as_dict()
+        meta = dict(frame_as_dict.get('meta', {}))
+        flags = 0
+        if meta.pop('internal', False):
+            flags |= self.FLAG_INTERNAL
+        timestamp = meta.get('timestamp', None)
+        if isinstance(timestamp, int) and not isinstance(timestamp, bool):
+            flags |= self.FLAG_TIMESTAMP
+            del meta['timestamp']
+        else:
+            timestamp = 0
+        frame_id = frame_as_dict.get('id', None)
+        binary_id = id_to_bytes(frame_id)
+        if binary_id is None:
+            binary_id = b''
+        else:
+            flags |= self.FLAG_BINARY_ID
+            frame_id = None
+        known_meta = [meta.pop(k, None) for k in self.META_KEYS]
+        body = [frame_as_dict.get('name', None), frame_as_dict.get('data', None),
+                known_meta, meta or None, frame_id]
+        header = self.HEADER.pack(flags, frame_as_dict.get('kind', 0), timestamp)
+        return header + binary_id + self._msgpack.packb(body, use_bin_type=True)
+
+    def decode(self, payload: Union[str, bytes], *,
+               source: Optional[str] = None,
+               trusted: bool = False) -> Frame:
+        if not isinstance(payload, (bytes, bytearray, memoryview)):
+            raise ValueError('Expected bytes payload for msgpack codec. '
+                             'Got: {}'.format(type(payload).__name__))
+        payload = bytes(payload)
+        flags, kind, timestamp = self.HEADER.unpack_from(payload)
+        offset = self.HEADER.size
+        frame_id = None  # type: Optional[str]
+        if flags & self.FLAG_BINARY_ID:
+            frame_id = id_from_bytes(payload[offset:offset + ID_BYTES])
+            offset += ID_BYTES
+        name, data, known_meta, meta, body_id = self._msgpack.unpackb(payload[offset:], raw=False)
+        meta = dict(meta or {})
+        for key, value in zip(self.META_KEYS, known_meta):
+            if value is not None:
+                meta[key] = value
+        if flags & self.FLAG_TIMESTAMP:
+            meta['timestamp'] = timestamp
+        meta['internal'] = bool(flags & self.FLAG_INTERNAL)
+        if source:
+            meta['source'] = source
+        return Frame.build(name, data=data, meta=meta, kind=kind,
+                           id=frame_id or body_id, trusted=trusted)
+
+
+CODECS = {
+    JsonCodec.name: JsonCodec,
+    MsgpackCodec.name: MsgpackCodec,
+}  # type: dict
+
+_INSTANCES = {}  # type: dict
+
+
+def register_codec(codec_class) -> None:
+    if not (isinstance(codec_class, type) and issubclass(codec_class, Codec)):
+        raise ValueError('Expected a subclass of zentropi.codecs.Codec. '
+                         'Got: {!r}'.format(codec_class))
+    CODECS[codec_class.name] = codec_class
+    _INSTANCES.pop(codec_class.name, None)
+
+
+def get_codec(codec: Union[str, Codec, None] = None) -> Codec:
+    """Returns a codec instance by name, defaults to json."""
+    if isinstance(codec, Codec):
+        return codec
+    codec = codec or JsonCodec.name
+    if codec not in _INSTANCES:
+        if codec not in CODECS:
+            raise ValueError('Expected codec to be one of: {!r}. '
+                             'Got: {!r}'.format(sorted(CODECS), codec))
+        _INSTANCES[codec] = CODECS[codec]()
+    return _INSTANCES[codec]
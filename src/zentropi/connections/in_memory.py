@@ -10,7 +10,8 @@ SPACES = {}  # type: dict
 
 
 class InMemoryConnection(Connection):
-    def __init__(self, agent: Zentropian) -> None:
+    def __init__(self, agent: Zentropian, codec=None) -> None:
+        """Frames are passed as objects, codec is accepted and ignored."""
         super().__init__()
         self._agent = agent
         self._endpoint = None  # type: Optional[str]
@@ -4,8 +4,8 @@ import os
 from typing import Optional
 
 from ..agent import Agent
+from ..codecs import get_codec
 from ..connections.connection import Connection
-from ..frames import Frame
 from ..utils import (
     validate_auth,
     validate_endpoint,
@@ -22,8 +22,9 @@ assert Optional  # ignore unused error for now.
 
 
 class RedisConnection(Connection):
-    def __init__(self, agent: Agent) -> None:
+    def __init__(self, agent: Agent, codec=None) -> None:
         super().__init__()
+        self._codec = get_codec(codec)
         self._subscriber = None  # type: ignore
         self._publisher = None  # type: ignore
         self._connection = None  # type: ignore
@@ -36,12 +37,15 @@ class RedisConnection(Connection):
     async def _connection_listener(self):
         connection = self._connection
         while await connection.wait_message():
-            frame_as_dict = await connection.get_json()
-            if not frame_as_dict:
+            handler_pool = getattr(self._agent, 'handler_pool', None)
+            if handler_pool is not None:
+                await handler_pool.wait_for_capacity()
+            payload = await connection.get()
+            if not payload:
                 break
             if not self._connected:
                 break
-            frame = Frame.from_dict(frame_as_dict)
+            frame = self._codec.decode(payload)
             # print('*** redis: incoming frame',
             #       self._agent.name, frame.source,  frame.name, frame.data)
             self._agent.handle_frame(frame)
@@ -112,8 +116,9 @@ class RedisConnection(Connection):
             spaces = [frame.space]
         else:
             spaces = self._spaces
+        payload = frame.encode(self._codec)
         for space in spaces:
             try:
-                await self._publisher.publish_json(space, frame.as_dict())
+                await self._publisher.publish(space, payload)
             except aioredis.errors.ConnectionClosedError:
                 self._connected = False
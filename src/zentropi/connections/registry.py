@@ -10,20 +10,20 @@ from .connection import Connection
 from .in_memory import InMemoryConnection
 
 
-def build_connection_instance(endpoint: str, connection_class: Connection, agent: Zentropian):
+def build_connection_instance(endpoint: str, connection_class: Connection, agent: Zentropian, **options):
     if connection_class and not isinstance(connection_class, Connection):
         raise ValueError('Expected connection_class to subclass zentropi.Connection. '
                          'Got: {!r}'.format(connection_class))
     if isinstance(connection_class, Connection):
-        return connection_class(agent=agent)  # type: ignore
+        return connection_class(agent=agent, **options)  # type: ignore
     if endpoint.startswith('inmemory://'):
-        return InMemoryConnection(agent=agent)
+        return InMemoryConnection(agent=agent, **options)
     elif endpoint.startswith('redis://'):
         from .redis_connection import RedisConnection
-        return RedisConnection(agent=agent)
+        return RedisConnection(agent=agent, **options)
     elif endpoint.startswith('wss://'):
         from .websocket_connection import WebsocketConnection
-        return WebsocketConnection(agent=agent)
+        return WebsocketConnection(agent=agent, **options)
     else:
         raise ValueError('Expected endpoint to be in {!r}. Got: {!r}.'
                          ''.format(['inmemory://'], endpoint))  # todo: generic list
@@ -44,8 +44,8 @@ class ConnectionRegistry(object):
     def connections(self):
         return [c for c in self._connections]
 
-    def connect(self, endpoint, *, auth=None, tag='default', connection_class=None):
-        connection = build_connection_instance(endpoint, connection_class, self._agent)
+    def connect(self, endpoint, *, auth=None, tag='default', connection_class=None, **options):
+        connection = build_connection_instance(endpoint, connection_class, self._agent, **options)
         if iscoroutinefunction(connection.connect):
             self._agent.spawn(connection.connect(endpoint, auth=auth))
         else:
@@ -54,8 +54,8 @@ class ConnectionRegistry(object):
         self._tags[tag].add(connection)
         self._endpoints[endpoint].add(connection)
 
-    def bind(self, endpoint, *, tag='default', connection_class=None):
-        connection = build_connection_instance(endpoint, connection_class, self._agent)
+    def bind(self, endpoint, *, tag='default', connection_class=None, **options):
+        connection = build_connection_instance(endpoint, connection_class, self._agent, **options)
         if iscoroutinefunction(connection.bind):
             self._agent.spawn(connection.bind(endpoint))
         else:
@@ -5,9 +5,9 @@ from typing import Optional
 
 import os
 import websockets
-from zentropi import Frame
 
 from ..agent import Agent
+from ..codecs import get_codec
 from ..connections.connection import Connection
 from ..utils import logger, validate_auth, validate_endpoint, validate_name
 
@@ -16,8 +16,9 @@ assert Optional  # ignore unused error for now.
 
 
 class WebsocketConnection(Connection):
-    def __init__(self, agent: Agent) -> None:
+    def __init__(self, agent: Agent, codec=None) -> None:
         super().__init__()
+        self._codec = get_codec(codec)
         self._agent = agent
         self._endpoint = ''
         self._spaces = set()
@@ -73,9 +74,12 @@ class WebsocketConnection(Connection):
             self.ws = websocket
             while self._connected:
                 try:
-                    text = await websocket.recv()
+                    handler_pool = getattr(self._agent, 'handler_pool', None)
+                    if handler_pool is not None:
+                        await handler_pool.wait_for_capacity()
+                    payload = await websocket.recv()
                     self.feed_watchdog()
-                    frame = Frame.from_json(text)
+                    frame = self._codec.decode(payload)
                     self._agent.handle_frame(frame)
                 except websockets.exceptions.ConnectionClosed as e:
                     logger.debug('disconnected {}'.format('; '.join(e.args)))
@@ -123,7 +127,7 @@ class WebsocketConnection(Connection):
             logger.debug('skipping broadcast, not connected')
             return
         try:
-            await self.ws.send(frame.as_json())
+            await self.ws.send(frame.encode(self._codec))
         except Exception as e:
             traceback.print_exc()
             self.close()
@@ -0,0 +1,97 @@
+# coding=utf-8
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from zentropi.defaults import DEDUP_CAPACITY, DEDUP_WINDOW
+
+
+class FrameDeduplicator(object):
+    """
+    Remembers recently seen frame ids for Agent.
+
+    Implementations provide `frame_id in dedup` and `dedup.add(frame_id)`
+    and keep the hits/misses/false_positives counters up to date.
+    """
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.false_positives = 0
+
+    def __contains__(self, frame_id: str) -> bool:
+        raise NotImplementedError()
+
+    def add(self, frame_id: str) -> None:
+        raise NotImplementedError()
+
+    def __len__(self) -> int:
+        raise NotImplementedError()
+
+    def stats(self) -> dict:
+        return {
+            'size': len(self),
+            'hits': self.hits,
+            'misses': self.misses,
+            'false_positives': self.false_positives,
+        }
+
+
+class RecentFrameIds(FrameDeduplicator):
+    """
+    Exact set of the frame ids seen within the last `window` seconds,
+    holding at most `capacity` ids; the oldest are evicted first.
+
+    Being exact, false_positives always stays at zero.
+
+        >>> from zentropi.dedup import RecentFrameIds
+        >>> seen = RecentFrameIds(capacity=2)
+        >>> seen.add('a'); seen.add('b'); seen.add('c')
+        >>> 'a' in seen, 'c' in seen
+        (False, True)
+    """
+
+    def __init__(self, capacity: int = DEDUP_CAPACITY, window: Optional[float] = DEDUP_WINDOW) -> None:
+        super().__init__()
+        if capacity < 1:
+            raise ValueError('Expected capacity to be >= 1. Got: {!r}'.format(capacity))
+        self._capacity = capacity
+        self._window = window
+        self._ids = OrderedDict()  # type: OrderedDict
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, frame_id: str) -> bool:
+        seen_at = self._ids.get(frame_id, None)
+        if seen_at is not None and (self._window is None or
+                                    time.monotonic() - seen_at <= self._window):
+            self.hits += 1
+            return True
+        self.misses += 1
+        return False
+
+    def add(self, frame_id: str) -> None:
+        ids = self._ids
+        now = time.monotonic()
+        if frame_id in ids:
+            ids.move_to_end(frame_id)
+        ids[frame_id] = now
+        while len(ids) > self._capacity:
+            ids.popitem(last=False)
+            self.evictions += 1
+        if self._window is None:
+            return
+        expired = now - self._window
+        while ids:
+            oldest = next(iter(ids))
+            if ids[oldest] >= expired:
+                break
+            del ids[oldest]
+            self.evictions += 1
+
+    def stats(self) -> dict:
+        stats = super().stats()
+        stats['evictions'] = self.evictions
+        return stats
@@ -5,9 +5,19 @@ LOCALE = 'en_US'
 LOG_LEVEL = logging.DEBUG
 
 MATCH_FUZZY_THRESHOLD = 70
+MATCH_FUZZY_CACHE_SIZE = 1024
 
 FRAME_NAME_MAX_LENGTH = 128
 
 FRAME_DATA_MAX_LENGTH = 1024 * 1024
 FRAME_META_MAX_LENGTH = 1024
 
+DEDUP_CAPACITY = 10000
+DEDUP_WINDOW = 60  # seconds
+
+HANDLER_POOL_CONCURRENCY = 100
+HANDLER_POOL_QUEUE_SIZE = 10000
+HANDLER_POOL_OVERFLOW = 'block'  # or: 'drop-oldest', 'drop-newest'
+
+HANDLER_EXECUTOR_THREADS = 8
+HANDLER_EXECUTOR_PROCESSES = None  # os.cpu_count()
@@ -16,7 +16,11 @@ class Events(Registry):
         pass
     """
     def emit(self, name, data=None, space=None, internal=False, source=None, reply_to=None):
-        frame_ = Event(name=name, data=data, space=space, source=source, reply_to=reply_to, internal=internal)
+        if internal:  # never leaves this agent, skip validation.
+            frame_ = Event.unchecked(name=name, data=data, space=space, source=source,
+                                     reply_to=reply_to, internal=internal)
+        else:
+            frame_ = Event(name=name, data=data, space=space, source=source, reply_to=reply_to, internal=internal)
         frame, handlers = self._registry.match(frame=frame_)
         for handler in handlers:
             ret_val = self._trigger_frame_handler(
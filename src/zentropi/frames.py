@@ -1,12 +1,12 @@
 # coding=utf-8
 import json
 import time
-from typing import Optional, Union
-from uuid import uuid4
+from types import MappingProxyType
+from typing import Mapping, Optional, Union
 
-from collections import UserDict
 from zentropi.defaults import FRAME_NAME_MAX_LENGTH
-from zentropi.symbols import KINDS
+from zentropi.ids import new_id
+from zentropi.symbols import KIND_VALUES, KINDS, KINDS_BY_VALUE
 from zentropi.utils import (
     deflate_dict,
     validate_data,
@@ -17,33 +17,60 @@ from zentropi.utils import (
 )
 
 
-class FrameData(UserDict):
+class FrameData(dict):
     """
-    FrameData is a wrapper around dict that supports
-    dot-notation access for keys and returns a None
-    instead of raising KeyError if the key is missing.
+    FrameData is a dict that supports dot-notation
+    access for keys and returns a None instead of
+    raising AttributeError if the key is missing.
 
     Used by:
         - zentropi.frames.Frame().data
     """
-
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
+    __slots__ = ()
 
     def __getattr__(self, item):
-        if item in self.data:
-            return self.data[item]
-        return None
+        if item.startswith('__'):
+            raise AttributeError(item)
+        return self.get(item, None)
 
     def __setattr__(self, key, value):
-        if key == 'data':
-            self.__dict__[key] = value
-        else:
-            self.__dict__['data'][key] = value
+        self[key] = value
+
+    def __delattr__(self, item):
+        del self[item]
+
+    @property
+    def data(self) -> dict:
+        """Backwards compatibility with the UserDict based FrameData."""
+        return self
+
+
+class FrozenFrameData(FrameData):
+    """
+    Read-only FrameData; copy it into a FrameData to make changes.
+
+    Used by:
+        - zentropi.frames.EMPTY_FRAME_DATA
+    """
+    __slots__ = ()
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError('{} is read-only, copy it into a FrameData first.'
+                        ''.format(type(self).__name__))
+
+    __setitem__ = __delitem__ = __setattr__ = __delattr__ = __ior__ = _readonly  # type: ignore
+    clear = pop = popitem = setdefault = update = _readonly  # type: ignore
+
+    def __reduce__(self):
+        return type(self), (dict(self),)
+
+
+EMPTY_FRAME_DATA = FrozenFrameData()
 
 
 class Frame(object):
-    __slots__ = ['_id', '_name', '_data', '_meta', '_kind']
+    __slots__ = ['_id', '_name', '_data', '_meta', '_kind', '_checked', '_encoded']
+    KIND = KINDS.UNSET.value
 
     def __init__(self,
                  name: str = None, *,
@@ -60,8 +87,8 @@ class Frame(object):
         self._name = validate_name(name)
         self._data = validate_data(data)
         self._meta = validate_meta(meta)
-        self._id = validate_id(id) or uuid4().hex
-        self._kind = validate_kind(kind) or KINDS.UNSET
+        self._id = validate_id(id) or new_id()
+        self._kind = KIND_VALUES[validate_kind(kind)]
         self._meta.update({'internal': bool(internal)})
         if source:
             self._meta.update({'source': validate_name(source)})
@@ -75,6 +102,66 @@ class Frame(object):
             self._meta.update({'timestamp': int(timestamp)})
         elif 'timestamp' not in self._meta:
             self._meta.update({'timestamp': int(time.time())})
+        self._checked = True
+        self._encoded = None  # type: Optional[dict]
+
+    @classmethod
+    def unchecked(cls,
+                  name: str = None, *,
+                  data: dict = None,
+                  meta: dict = None,
+                  kind=None,
+                  id: str = None,
+                  source: str = None,
+                  target: str = None,
+                  space: str = None,
+                  reply_to: str = None,
+                  timestamp: int = None,
+                  internal: bool = False) -> 'Frame':
+        """
+        Build a frame from trusted input without running the validators.
+
+        Meant for frames created by zentropi itself (internal events,
+        state changes) and frames decoded from trusted transports.
+        The name length and the size limits on data and meta are
+        checked lazily, the first time the frame is serialized
+        with as_dict().
+        """
+        frame = cls.__new__(cls)
+        frame._name = name
+        if isinstance(data, FrameData):
+            frame._data = data
+        else:
+            frame._data = FrameData(data) if data else EMPTY_FRAME_DATA
+        frame._meta = meta if meta is not None else {}
+        frame._id = id or new_id()
+        if cls is Frame:
+            frame._kind = KIND_VALUES[validate_kind(kind)]
+        else:
+            frame._kind = cls.KIND
+        frame._checked = False
+        frame._encoded = None
+        meta_ = frame._meta
+        meta_['internal'] = bool(internal)
+        if source:
+            meta_['source'] = source
+        if target:
+            meta_['target'] = target
+        if space:
+            meta_['space'] = space
+        if reply_to:
+            meta_['reply_to'] = reply_to
+        if timestamp:
+            meta_['timestamp'] = int(timestamp)
+        elif 'timestamp' not in meta_:
+            meta_['timestamp'] = int(time.time())
+        return frame
+
+    def _check_size(self) -> None:
+        validate_name(self._name)
+        validate_data(self._data)
+        validate_meta(self._meta)
+        self._checked = True
 
     @property
     def name(self) -> Optional[str]:
@@ -83,22 +170,25 @@ class Frame(object):
     @name.setter
     def name(self, name: str) -> None:
         self._name = validate_name(name)
+        self._encoded = None
 
     @property
     def data(self) -> dict:
-        return self._data or FrameData()
+        return self._data
 
     @data.setter
     def data(self, data: dict) -> None:
         self._data = validate_data(data)
+        self._encoded = None
 
     @property
-    def meta(self) -> Optional[dict]:
-        return self._meta
+    def meta(self) -> Mapping:
+        """Read-only view, use the space, target and reply_to setters."""
+        return MappingProxyType(self._meta)
 
     @property
-    def kind(self) -> Optional[int]:
-        return self._kind
+    def kind(self) -> KINDS:
+        return KINDS_BY_VALUE[self._kind]
 
     @property
     def id(self) -> Optional[str]:
@@ -115,6 +205,7 @@ class Frame(object):
     @space.setter
     def space(self, space: str) -> None:
         self._meta['space'] = space
+        self._encoded = None
 
     @property
     def target(self) -> Optional[str]:
@@ -123,6 +214,7 @@ class Frame(object):
     @target.setter
     def target(self, agent: str) -> None:
         self._meta['target'] = agent
+        self._encoded = None
 
     @property
     def reply_to(self) -> Optional[str]:
@@ -131,6 +223,7 @@ class Frame(object):
     @reply_to.setter
     def reply_to(self, agent: str) -> None:
         self._meta['reply_to'] = agent
+        self._encoded = None
 
     @property
     def timestamp(self) -> Optional[str]:
@@ -145,51 +238,75 @@ class Frame(object):
               data: dict = None,
               meta: dict = None,
               kind=None,
-              id: str = None) -> Union['Frame', 'Command', 'Event']:
-        if kind == KINDS.COMMAND or kind == KINDS.COMMAND.value:
-            return Command(name, data=data, meta=meta, kind=kind, id=id)
-        elif kind == KINDS.EVENT or kind == KINDS.EVENT.value:
-            return Event(name, data=data, meta=meta, kind=kind, id=id)
-        elif kind == KINDS.MESSAGE or kind == KINDS.MESSAGE.value:
-            return Message(name, data=data, meta=meta, kind=kind, id=id)
-        elif kind == KINDS.REQUEST or kind == KINDS.REQUEST.value:
-            return Request(name, data=data, meta=meta, kind=kind, id=id)
-        elif kind == KINDS.RESPONSE or kind == KINDS.RESPONSE.value:
-            return Response(name, data=data, meta=meta, kind=kind, id=id)
-        elif kind == KINDS.STATE or kind == KINDS.STATE.value:
-            return State(name, data=data, meta=meta, kind=kind, id=id)
-        else:
-            return Frame(name, data=data, meta=meta, kind=kind, id=id)
+              id: str = None,
+              trusted: bool = False) -> Union['Frame', 'Command', 'Event']:
+        try:
+            frame_class = FRAME_CLASSES.get(kind, Frame)
+        except TypeError:  # unhashable, let validate_kind() raise.
+            frame_class = Frame
+        if trusted:
+            if frame_class is Frame:
+                return Frame.unchecked(name, data=data, meta=meta, kind=kind, id=id)
+            return frame_class.unchecked(name, data=data, meta=meta, id=id)
+        return frame_class(name, data=data, meta=meta, kind=kind, id=id)
 
     @staticmethod
-    def from_dict(frame_as_dict):
-        return Frame.build(**frame_as_dict)
+    def from_dict(frame_as_dict, trusted=False):
+        return Frame.build(trusted=trusted, **frame_as_dict)
 
     @staticmethod
-    def from_json(frame_as_json, source=None):
+    def from_json(frame_as_json, source=None, trusted=False):
         frame_kwargs = json.loads(frame_as_json)
         if source:
             if 'meta' in frame_kwargs:
                 frame_kwargs['meta']['source'] = source
             else:
                 frame_kwargs.update({'meta': {'source': source}})
-        return Frame.build(**frame_kwargs)
+        return Frame.build(trusted=trusted, **frame_kwargs)
 
     def as_dict(self) -> dict:
+        if not self._checked:
+            self._check_size()
         return deflate_dict({
             'id': self.id,
             'name': self._name,
-            'data': self._data.data,
+            'data': self._data,
             'meta': self._meta,
-            'kind': self._kind.value,
+            'kind': self._kind,
         })
 
     def as_json(self) -> str:
-        return json.dumps(self.as_dict())
+        return self.encode('json')  # type: ignore
+
+    def encode(self, codec=None) -> Union[str, bytes]:
+        """
+        Encoded once per codec and cached; the cache is dropped when
+        name, data, space, target or reply_to are assigned. Once
+        encoded, frame.data is frozen so it cannot go stale in place;
+        assign a new dict to frame.data to change it.
+        """
+        from zentropi.codecs import get_codec
+        codec = get_codec(codec)
+        encoded = self._encoded
+        if encoded is None:
+            encoded = self._encoded = {}
+            if not isinstance(self._data, FrozenFrameData):
+                self._data = FrozenFrameData(self._data)
+        payload = encoded.get(codec.name, None)
+        if payload is None:
+            payload = encoded[codec.name] = codec.encode(self)
+        return payload
+
+    @staticmethod
+    def decode(payload: Union[str, bytes], codec=None, *,
+               source: str = None, trusted: bool = False) -> 'Frame':
+        from zentropi.codecs import get_codec
+        return get_codec(codec).decode(payload, source=source, trusted=trusted)
 
 
 class Command(Frame):
-    __slots__ = ['_id', '_name', '_data', '_meta', '_kind']
+    __slots__ = ['_id', '_name', '_data', '_meta', '_kind', '_checked', '_encoded']
+    KIND = KINDS.COMMAND.value
 
     def __init__(self,
                  name: str = None, *,
@@ -203,14 +320,14 @@ class Command(Frame):
                  reply_to: str = None,
                  timestamp: int = None,
                  internal: bool = False) -> None:
-        super().__init__(name, data=data, meta=meta, kind=KINDS.COMMAND, id=id,
+        super().__init__(name, data=data, meta=meta, kind=self.KIND, id=id,
                          source=source, target=target, space=space,
                          reply_to=reply_to, timestamp=timestamp, internal=internal)
-        self._kind = KINDS.COMMAND
 
 
 class Event(Frame):
-    __slots__ = ['_id', '_name', '_data', '_meta', '_kind']
+    __slots__ = ['_id', '_name', '_data', '_meta', '_kind', '_checked', '_encoded']
+    KIND = KINDS.EVENT.value
 
     def __init__(self,
                  name: str = None, *,
@@ -224,14 +341,14 @@ class Event(Frame):
                  reply_to: str = None,
                  timestamp: int = None,
                  internal: bool = False) -> None:
-        super().__init__(name, data=data, meta=meta, kind=KINDS.EVENT, id=id,
+        super().__init__(name, data=data, meta=meta, kind=self.KIND, id=id,
                          source=source, target=target, space=space,
                          reply_to=reply_to, timestamp=timestamp, internal=internal)
-        self._kind = KINDS.EVENT
 
 
 class Message(Frame):
-    __slots__ = ['_id', '_name', '_data', '_meta', '_kind']
+    __slots__ = ['_id', '_name', '_data', '_meta', '_kind', '_checked', '_encoded']
+    KIND = KINDS.MESSAGE.value
 
     def __init__(self,
                  name: str = None, *,
@@ -248,12 +365,21 @@ class Message(Frame):
         name_ = name
         if name and len(name) > FRAME_NAME_MAX_LENGTH:
             name = name[:FRAME_NAME_MAX_LENGTH]
-        super().__init__(name, data=data, meta=meta, kind=KINDS.MESSAGE, id=id,
+        super().__init__(name, data=data, meta=meta, kind=self.KIND, id=id,
                          source=source, target=target, space=space,
                          reply_to=reply_to, timestamp=timestamp, internal=internal)
         if 'text' not in self._data:
-            self._data.text = name_
-        self._kind = KINDS.MESSAGE
+            self._data = FrameData(self._data, text=name_)
+
+    @classmethod
+    def unchecked(cls, name: str = None, **kwargs) -> 'Message':  # type: ignore
+        name_ = name
+        if name and len(name) > FRAME_NAME_MAX_LENGTH:
+            name = name[:FRAME_NAME_MAX_LENGTH]
+        message = super().unchecked(name, **kwargs)
+        if 'text' not in message._data:
+            message._data = FrameData(message._data, text=name_)
+        return message
 
     @property
     def text(self):
@@ -263,7 +389,8 @@ class Message(Frame):
 
 
 class Request(Frame):
-    __slots__ = ['_id', '_name', '_data', '_meta', '_kind']
+    __slots__ = ['_id', '_name', '_data', '_meta', '_kind', '_checked', '_encoded']
+    KIND = KINDS.REQUEST.value
 
     def __init__(self,
                  name: str = None, *,
@@ -277,14 +404,14 @@ class Request(Frame):
                  reply_to: str = None,
                  timestamp: int = None,
                  internal: bool = False) -> None:
-        super().__init__(name, data=data, meta=meta, kind=KINDS.REQUEST, id=id,
+        super().__init__(name, data=data, meta=meta, kind=self.KIND, id=id,
                          source=source, target=target, space=space,
                          reply_to=reply_to, timestamp=timestamp, internal=internal)
-        self._kind = KINDS.REQUEST
 
 
 class Response(Frame):
-    __slots__ = ['_id', '_name', '_data', '_meta', '_kind']
+    __slots__ = ['_id', '_name', '_data', '_meta', '_kind', '_checked', '_encoded']
+    KIND = KINDS.RESPONSE.value
 
     def __init__(self,
                  name: str = None, *,
@@ -298,14 +425,14 @@ class Response(Frame):
                  reply_to: str = None,
                  timestamp: int = None,
                  internal: bool = False) -> None:
-        super().__init__(name, data=data, meta=meta, kind=KINDS.RESPONSE, id=id,
+        super().__init__(name, data=data, meta=meta, kind=self.KIND, id=id,
                          source=source, target=target, space=space,
                          reply_to=reply_to, timestamp=timestamp, internal=internal)
-        self._kind = KINDS.RESPONSE
 
 
 class State(Frame):
-    __slots__ = ['_id', '_name', '_data', '_meta', '_kind']
+    __slots__ = ['_id', '_name', '_data', '_meta', '_kind', '_checked', '_encoded']
+    KIND = KINDS.STATE.value
 
     def __init__(self,
                  name: str = None, *,
@@ -319,7 +446,11 @@ class State(Frame):
                  reply_to: str = None,
                  timestamp: int = None,
                  internal: bool = False) -> None:
-        super().__init__(name, data=data, meta=meta, kind=KINDS.STATE, id=id,
+        super().__init__(name, data=data, meta=meta, kind=self.KIND, id=id,
                          source=source, target=target, space=space,
                          reply_to=reply_to, timestamp=timestamp, internal=internal)
-        self._kind = KINDS.STATE
+
+
+# Frame.build() dispatch, keyed by both KINDS members and their int values.
+FRAME_CLASSES = {c.KIND: c for c in (Command, Event, Message, Request, Response, State)}  # type: dict
+FRAME_CLASSES.update({KINDS_BY_VALUE[k]: c for k, c in FRAME_CLASSES.items()})
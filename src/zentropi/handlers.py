@@ -4,30 +4,41 @@ from inspect import (
     iscoroutinefunction
 )
 
-from collections import defaultdict
-from fuzzywuzzy import fuzz, process
-from parse import parse as string_parse
-from sortedcontainers import SortedListWithKey
-from zentropi.defaults import \
+from collections import OrderedDict, defaultdict
+from itertools import count
+from math import ceil, floor
+from fuzzywuzzy import fuzz
+from fuzzywuzzy.utils import full_process
+from parse import compile as parse_compile
+from sortedcontainers import SortedList
+from zentropi.defaults import (
+    MATCH_FUZZY_CACHE_SIZE,
     MATCH_FUZZY_THRESHOLD
+)
+from zentropi.frames import FrameData
+from zentropi.symbols import KINDS
 from zentropi.utils import (
     validate_handler,
     validate_kind,
     validate_name
 )
 
+EXECUTOR_THREAD = 'thread'
+EXECUTOR_PROCESS = 'process'
+EXECUTORS = (EXECUTOR_THREAD, EXECUTOR_PROCESS)
+
 
 class Handler(object):
     __slots__ = [
         '_kind', '_name', '_handler',
         '_meta', '_async', '_pass_self',
         '_match_exact', '_match_parse', '_match_fuzzy',
-        '_ignore_case', '_length', '_filters'
+        '_ignore_case', '_length', '_filters', '_executor'
     ]
 
     def __init__(self, kind, name, handler, meta=None,
                  exact=True, parse=False, fuzzy=False,
-                 ignore_case=False, **kwargs):
+                 ignore_case=False, executor=None, **kwargs):
         if callable(handler) and not iscoroutinefunction(handler):
             self._async = False
         elif iscoroutinefunction(handler):
@@ -48,6 +59,19 @@ class Handler(object):
                              'to be True.'.format(parse, fuzzy))
         if parse or fuzzy:
             exact = False
+        if executor is not None:
+            if executor not in EXECUTORS:
+                raise ValueError('Expected executor to be one of: {!r}. '
+                                 'Got: {!r}'.format(EXECUTORS, executor))
+            if self._async:
+                raise ValueError('Expected a sync handler for executor={!r}, '
+                                 'coroutine functions already run on the loop.'.format(executor))
+            if validate_kind(kind) == KINDS.STATE:
+                raise ValueError('State handlers must return right away, '
+                                 'executor is not supported for them.')
+            if executor == EXECUTOR_PROCESS and self._pass_self:
+                raise ValueError('Handlers run in a process can not take self.')
+        self._executor = executor
         self._kind = validate_kind(kind)
         self._name = validate_name(name)
         self._handler = handler
@@ -88,6 +112,14 @@ class Handler(object):
     def run_async(self):
         return self._async
 
+    @property
+    def executor(self):
+        return self._executor
+
+    @property
+    def func(self):
+        return self._handler
+
     @property
     def pass_self(self):
         return self._pass_self
@@ -125,18 +157,191 @@ class Handler(object):
         return deflate_dict(description)
 
 
+class _TrieNode(object):
+    __slots__ = ['children', 'patterns']
+
+    def __init__(self):
+        self.children = {}  # type: dict
+        self.patterns = []  # type: list
+
+
+class ParseIndex(object):
+    """
+    Index of parse-mode patterns for HandlerRegistry.match_parse().
+
+    Each pattern is compiled once with parse.compile() and stored in
+    a trie under its literal leading text (lower-cased, since parse
+    matches case-insensitively), so only patterns whose prefix matches
+    the incoming string are tried, longest pattern first.
+    """
+
+    def __init__(self):
+        self._root = _TrieNode()
+        self._patterns = {}  # {pattern: [parser, rank, refcount]}
+        self._counter = count()
+
+    def __len__(self):
+        return len(self._patterns)
+
+    def __contains__(self, pattern):
+        return pattern in self._patterns
+
+    def __iter__(self):
+        return iter(self._patterns)
+
+    @staticmethod
+    def literal_prefix(pattern):
+        prefix = []
+        index, length = 0, len(pattern)
+        while index < length:
+            if pattern.startswith('{{', index) or pattern.startswith('}}', index):
+                prefix.append(pattern[index])
+                index += 2
+            elif pattern[index] == '{':
+                break
+            else:
+                prefix.append(pattern[index])
+                index += 1
+        return ''.join(prefix).lower()
+
+    def _node(self, prefix, create=False):
+        node = self._root
+        for char in prefix:
+            child = node.children.get(char)
+            if child is None:
+                if not create:
+                    return None
+                child = node.children[char] = _TrieNode()
+            node = child
+        return node
+
+    def add(self, pattern):
+        if pattern in self._patterns:
+            self._patterns[pattern][2] += 1
+            return
+        rank = (len(pattern), next(self._counter))
+        self._patterns[pattern] = [parse_compile(pattern), rank, 1]
+        self._node(self.literal_prefix(pattern), create=True).patterns.append(pattern)
+
+    def remove(self, pattern):
+        entry = self._patterns[pattern]
+        entry[2] -= 1
+        if entry[2] > 0:
+            return
+        del self._patterns[pattern]
+        self._node(self.literal_prefix(pattern)).patterns.remove(pattern)
+
+    def candidates(self, string):
+        """Patterns whose literal prefix matches string, longest first."""
+        node = self._root
+        candidates = list(node.patterns)
+        for char in string.lower():
+            node = node.children.get(char)
+            if node is None:
+                break
+            candidates.extend(node.patterns)
+        patterns = self._patterns
+        candidates.sort(key=lambda p: patterns[p][1], reverse=True)
+        return candidates
+
+    def match(self, string):
+        """Returns (pattern, parse.Result) or (None, None)."""
+        for pattern in self.candidates(string):
+            result = self._patterns[pattern][0].parse(string)
+            if result:
+                return pattern, result
+        return None, None
+
+
+class FuzzyIndex(object):
+    """
+    Index of fuzzy-mode names for HandlerRegistry.match_fuzzy().
+
+    Scores are the same as fuzz.token_sort_ratio, but names are
+    normalized and token-sorted once when added. Only names whose
+    normalized length can still reach the threshold are scored, and
+    the best match for recently seen strings is kept in an LRU cache
+    that is cleared whenever the index changes.
+    """
+
+    def __init__(self, threshold=MATCH_FUZZY_THRESHOLD, cache_size=MATCH_FUZZY_CACHE_SIZE):
+        self._threshold = threshold
+        self._cache_size = cache_size
+        self._cache = OrderedDict()  # type: OrderedDict
+        self._names = {}  # {name: [key, rank, refcount]}
+        self._by_length = SortedList()  # [(len(key), rank, name)]
+        self._counter = count()
+
+    def __len__(self):
+        return len(self._names)
+
+    def __contains__(self, name):
+        return name in self._names
+
+    def __iter__(self):
+        return iter(self._names)
+
+    @staticmethod
+    def normalize(string):
+        processed = full_process(full_process(string), force_ascii=True)
+        return ' '.join(sorted(processed.split()))
+
+    def add(self, name):
+        if name in self._names:
+            self._names[name][2] += 1
+            return
+        key = self.normalize(name)
+        rank = (len(name), next(self._counter))
+        self._names[name] = [key, rank, 1]
+        self._by_length.add((len(key), rank, name))
+        self._cache.clear()
+
+    def remove(self, name):
+        entry = self._names[name]
+        entry[2] -= 1
+        if entry[2] > 0:
+            return
+        del self._names[name]
+        self._by_length.remove((len(entry[0]), entry[1], name))
+        self._cache.clear()
+
+    def _candidates(self, length):
+        # ratio = 2 * matches / (len1 + len2) and matches <= min(len1, len2),
+        # which bounds the lengths that can still score >= threshold.
+        ratio = (self._threshold - 0.5) / 100.0
+        if ratio <= 0:
+            return iter(self._by_length)
+        lowest = int(ceil(ratio * length / (2 - ratio)))
+        highest = int(floor(length * (2 - ratio) / ratio))
+        return self._by_length.irange((lowest,), (highest + 1,), inclusive=(True, False))
+
+    def match(self, string):
+        """Returns (name, score) for the best match above threshold, or None."""
+        cache = self._cache
+        if string in cache:
+            cache.move_to_end(string)
+            return cache[string]
+        key = self.normalize(string)
+        best, best_score, best_rank = None, -1, None
+        for _, rank, name in self._candidates(len(key)):
+            score = fuzz.ratio(key, self._names[name][0])
+            if score > best_score or (score == best_score and rank < best_rank):
+                best, best_score, best_rank = name, score, rank
+        result = (best, best_score) if best is not None and best_score >= self._threshold else None
+        cache[string] = result
+        if len(cache) > self._cache_size:
+            cache.popitem(last=False)
+        return result
+
+
 class HandlerRegistry(object):
     def __init__(self):
         self._handlers = defaultdict(set)
-        self._index_exact = SortedListWithKey(key=len)
-        self._index_parse = SortedListWithKey(key=len)
-        self._index_fuzzy = SortedListWithKey(key=len)
-        self.match_functions = {
-            self.match_exact: self._index_exact,
-            self.match_parse: self._index_parse,
-            self.match_fuzzy: self._index_fuzzy
-        }
-        self._catch_all_handlers = set()
+        self._index_parse = ParseIndex()
+        self._index_fuzzy = FuzzyIndex()
+        self._dispatch_exact = {}  # type: dict
+        self._dispatch_ignore_case = {}  # type: dict
+        self._catch_all_handlers = frozenset()  # type: frozenset
 
     @property
     def handlers(self):
@@ -163,72 +368,92 @@ class HandlerRegistry(object):
             raise ValueError('Handler: {!r} already assigned to: {!r}'
                              ''.format(handler, name))
         self._handlers[name].add(handler)
-        if handler.match_exact:
-            self._index_exact.add(name)
-        elif handler.match_parse:
+        if handler.match_parse:
             self._index_parse.add(name)
-        else:  # handler.match_fuzzy:
+        elif handler.match_fuzzy:
             self._index_fuzzy.add(name)
-        if '*' in self._handlers:
-            self._catch_all_handlers = self._handlers['*']
+        self._compile()
 
     def remove_handler(self, name, handler):
+        if handler.ignore_case:
+            name = name.lower()
         self._handlers[name].remove(handler)
-        if handler.match_exact:
-            self._index_exact.remove(name)
-        elif handler.match_parse:
+        if handler.match_parse:
             self._index_parse.remove(name)
-        else:  # handler.match_fuzzy:
+        elif handler.match_fuzzy:
             self._index_fuzzy.remove(name)
+        self._compile()
+
+    def _compile(self):
+        """
+        Rebuild the dispatch tables used by match_exact().
+
+        Exact names map straight to their handlers, so a hit costs
+        a single dict lookup; ignore_case handlers are also indexed
+        under their lower-cased name for the fallback lookup.
+        """
+        dispatch_exact = defaultdict(set)
+        dispatch_ignore_case = defaultdict(set)
+        for name, handlers in self._handlers.items():
+            for handler in handlers:
+                if not handler.match_exact:
+                    continue
+                dispatch_exact[name].add(handler)
+                if handler.ignore_case:
+                    dispatch_ignore_case[name].add(handler)
+        self._dispatch_exact = {k: frozenset(v) for k, v in dispatch_exact.items()}
+        self._dispatch_ignore_case = {k: frozenset(v) for k, v in dispatch_ignore_case.items()}
+        self._catch_all_handlers = frozenset(self._handlers.get('*', ()))
 
     def match(self, frame):
-        for match_function, index in self.match_functions.items():
-            if not index:
-                continue
-            frame_, handlers = match_function(frame)
-            if not handlers:
-                continue
+        frame_, handlers = self.match_exact(frame)
+        if handlers:
             return frame_, handlers
-        else:
-            if self._catch_all_handlers:
-                return frame, self._catch_all_handlers
-            return frame, set()
+        if self._index_parse:
+            frame_, handlers = self.match_parse(frame)
+            if handlers:
+                return frame_, handlers
+        if self._index_fuzzy:
+            frame_, handlers = self.match_fuzzy(frame)
+            if handlers:
+                return frame_, handlers
+        if self._catch_all_handlers:
+            return frame, self._catch_all_handlers
+        return frame, set()
 
     def match_exact(self, frame):
         name = frame.name
-        if name in self._index_exact:
-            return frame, self._handlers[frame.name]
-        if name.lower() in self._index_exact:
-            handlers_ = self._handlers[name.lower()]
-            return frame, {h for h in handlers_ if h.ignore_case is True}
+        handlers = self._dispatch_exact.get(name)
+        if handlers:
+            return frame, handlers
+        if name is not None and self._dispatch_ignore_case:
+            handlers = self._dispatch_ignore_case.get(name.lower())
+            if handlers:
+                return frame, handlers
         return frame, set()
 
     def match_parse(self, frame):
-        for pattern in reversed(self._index_parse):
-            if isinstance(frame.data.text, str):
-                match_string = frame.data.text
-            else:
-                match_string = frame.name
-            res = string_parse(
-                format=pattern, string=match_string)
-            if not res:
-                continue
-            handlers = self._handlers[pattern]
-            data = frame.data
-            data.update(**res.named)
-            data.update({'args': res.fixed})
-            frame.data = data
-            return frame, handlers
+        if isinstance(frame.data.text, str):
+            match_string = frame.data.text
         else:
+            match_string = frame.name
+        if match_string is None:
+            return frame, set()
+        pattern, res = self._index_parse.match(match_string)
+        if not res:
             return frame, set()
+        handlers = self._handlers[pattern]
+        data = FrameData(frame.data)
+        data.update(**res.named)
+        data.update({'args': res.fixed})
+        frame.data = data
+        return frame, handlers
 
     def match_fuzzy(self, frame):
-        if not self._index_fuzzy:
+        if not self._index_fuzzy or frame.name is None:
             return frame, set()
-        pattern = process.extractOne(
-            frame.name, self._index_fuzzy,
-            scorer=fuzz.token_sort_ratio)
-        if not pattern or pattern[1] < MATCH_FUZZY_THRESHOLD:
+        pattern = self._index_fuzzy.match(frame.name)
+        if not pattern:
             return frame, set()
         return frame, self._handlers[pattern[0]]
 
@@ -0,0 +1,133 @@
+# coding=utf-8
+import os
+import threading
+import time
+import weakref
+from typing import Callable, Optional
+from uuid import uuid4
+
+ID_LENGTH = 32
+ID_BYTES = 16
+ID_VERSION = 7
+COUNTER_BITS = 42
+
+_generators = weakref.WeakSet()  # type: weakref.WeakSet
+
+
+def _reset_nodes_after_fork() -> None:
+    for generator in list(_generators):
+        generator.reset_node()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_nodes_after_fork)
+
+
+class MonotonicIdGenerator(object):
+    """
+    Generates time-ordered 128 bit frame ids.
+
+    Ids are 32 character hex strings laid out like a version 7 UUID:
+    a 48 bit unix time in milliseconds, the version and variant bits,
+    a 32 bit node (random per process) and a 42 bit counter. Ids from
+    one process are strictly increasing, ids from different processes
+    sort by millisecond. Only the node needs os.urandom(), once.
+
+        >>> from zentropi.ids import MonotonicIdGenerator
+        >>> generate = MonotonicIdGenerator()
+        >>> first, second = generate(), generate()
+        >>> first < second
+        True
+    """
+
+    def __init__(self, node: Optional[int] = None) -> None:
+        self._lock = threading.Lock()
+        self._last = 0
+        self._counter = 0
+        self._fixed_node = node
+        self.reset_node()
+        if node is None:
+            _generators.add(self)
+
+    @property
+    def node(self) -> str:
+        return self._node
+
+    def reset_node(self) -> None:
+        node = self._fixed_node
+        if node is None:
+            node = int.from_bytes(os.urandom(4), 'big')
+        self._node_value = node & 0xffffffff
+        self._node = '{:08x}'.format(self._node_value)
+
+    def __call__(self) -> str:
+        now = int(time.time() * 1000)
+        with self._lock:
+            if now < self._last:  # clock went backwards, stay ordered.
+                now = self._last
+            self._last = now
+            self._counter = (self._counter + 1) & ((1 << COUNTER_BITS) - 1)
+            counter = self._counter
+        node = self._node_value
+        value = ((now & 0xffffffffffff) << 80 | ID_VERSION << 76 | (node >> 20) << 64 |
+                 0b10 << 62 | (node & 0xfffff) << COUNTER_BITS | counter)
+        return '{:032x}'.format(value)
+
+
+def random_id() -> str:
+    """The original uuid4 based frame ids."""
+    return uuid4().hex
+
+
+_generator = MonotonicIdGenerator()  # type: Callable[[], str]
+
+
+def new_id() -> str:
+    return _generator()
+
+
+def get_id_generator() -> Callable[[], str]:
+    return _generator
+
+
+def set_id_generator(generator: Callable[[], str]) -> None:
+    """
+    Replace the frame id generator for this process.
+
+        >>> from zentropi.ids import random_id, set_id_generator
+        >>> set_id_generator(random_id)  # doctest: +SKIP
+    """
+    global _generator
+    if not callable(generator):
+        raise ValueError('Expected a callable for generator, got: {!r}'
+                         ''.format(generator))
+    _generator = generator
+
+
+def id_to_bytes(frame_id: Optional[str]) -> Optional[bytes]:
+    """
+    Compact 16 byte form of a 32 character lower-case hex id, None
+    for any id that would not survive the round trip through bytes.
+    """
+    if not isinstance(frame_id, str) or len(frame_id) != ID_LENGTH:
+        return None
+    try:
+        binary_id = bytes.fromhex(frame_id)
+    except ValueError:
+        return None
+    if len(binary_id) != ID_BYTES or binary_id.hex() != frame_id:
+        return None
+    return binary_id
+
+
+def id_from_bytes(frame_id: bytes) -> str:
+    return frame_id.hex()
+
+
+def id_timestamp(frame_id: str) -> Optional[float]:
+    """Unix time encoded in an id from MonotonicIdGenerator, None if unknown."""
+    if id_to_bytes(frame_id) is None:
+        return None
+    if frame_id[12] != str(ID_VERSION) or frame_id[16] not in '89ab':
+        return None
+    return int(frame_id[:12], 16) / 1000.0
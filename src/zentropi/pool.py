@@ -0,0 +1,132 @@
+# coding=utf-8
+import asyncio
+from collections import deque
+
+from zentropi.defaults import (
+    HANDLER_POOL_CONCURRENCY,
+    HANDLER_POOL_OVERFLOW,
+    HANDLER_POOL_QUEUE_SIZE
+)
+
+OVERFLOW_BLOCK = 'block'
+OVERFLOW_DROP_NEWEST = 'drop-newest'
+OVERFLOW_DROP_OLDEST = 'drop-oldest'
+OVERFLOW_POLICIES = (OVERFLOW_BLOCK, OVERFLOW_DROP_NEWEST, OVERFLOW_DROP_OLDEST)
+
+
+class HandlerPool(object):
+    """
+    Runs an Agent's async handlers, at most `concurrency` at a time.
+
+    Opt-in: an Agent without a handler_pool spawns every async handler
+    right away, as before. Up to `queue_size` more jobs wait in a
+    queue, which never grows past that. When it is full, `overflow`
+    decides what happens to a new job:
+
+        - 'drop-newest': the new job is dropped.
+        - 'drop-oldest': the oldest queued job is dropped.
+        - 'block': transport readers (redis, websocket) await
+          wait_for_capacity() and stop reading until the queue drains.
+          Producers that cannot wait (local emit, in-memory delivery,
+          timers) call submit() synchronously; on a full queue their
+          job is dropped like 'drop-newest', and counted in `dropped`.
+
+        >>> from zentropi import Agent
+        >>> from zentropi.pool import HandlerPool
+        >>> agent = Agent(handler_pool=HandlerPool(concurrency=10, overflow='drop-oldest'))
+    """
+
+    def __init__(self, concurrency: int = HANDLER_POOL_CONCURRENCY,
+                 queue_size: int = HANDLER_POOL_QUEUE_SIZE,
+                 overflow: str = HANDLER_POOL_OVERFLOW) -> None:
+        if concurrency < 1:
+            raise ValueError('Expected concurrency to be >= 1. Got: {!r}'.format(concurrency))
+        if queue_size < 1:
+            raise ValueError('Expected queue_size to be >= 1. Got: {!r}'.format(queue_size))
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError('Expected overflow to be one of: {!r}. Got: {!r}'
+                             ''.format(OVERFLOW_POLICIES, overflow))
+        self._concurrency = concurrency
+        self._queue_size = queue_size
+        self._overflow = overflow
+        self._queue = deque()  # type: deque
+        self._running = 0
+        self._spawn = None
+        self._capacity_waiters = []  # type: list
+        self.submitted = 0
+        self.completed = 0
+        self.dropped = 0
+
+    def bind(self, spawn) -> None:
+        """Set the function used to schedule coroutines, usually Agent.spawn."""
+        if not callable(spawn):
+            raise ValueError('Expected a callable for spawn, got: {!r}'.format(spawn))
+        self._spawn = spawn
+
+    @property
+    def running(self) -> int:
+        return self._running
+
+    @property
+    def depth(self) -> int:
+        return len(self._queue)
+
+    @property
+    def full(self) -> bool:
+        return len(self._queue) >= self._queue_size
+
+    def submit(self, job) -> bool:
+        """
+        Run job, a callable returning a coroutine, now or when a slot frees up.
+        Returns False if the job was dropped.
+        """
+        if self._spawn is None:
+            raise AssertionError('HandlerPool is not bound, call bind(spawn) first.')
+        self.submitted += 1
+        if self._running < self._concurrency:
+            self._start(job)
+            return True
+        if self.full:
+            if self._overflow != OVERFLOW_DROP_OLDEST:
+                self.dropped += 1
+                return False
+            self._queue.popleft()
+            self.dropped += 1
+        self._queue.append(job)
+        return True
+
+    def _start(self, job) -> None:
+        self._running += 1
+        self._spawn(self._run(job))
+
+    async def _run(self, job) -> None:
+        try:
+            await job()
+        finally:
+            self._running -= 1
+            self.completed += 1
+            if self._queue:
+                self._start(self._queue.popleft())
+            if self._capacity_waiters and not self.full:
+                waiters, self._capacity_waiters = self._capacity_waiters, []
+                for waiter in waiters:
+                    if not waiter.done():
+                        waiter.set_result(None)
+
+    async def wait_for_capacity(self) -> None:
+        """Transports await this before reading the next frame, only 'block' waits."""
+        if self._overflow != OVERFLOW_BLOCK:
+            return
+        while self.full:
+            waiter = asyncio.get_event_loop().create_future()  # type: asyncio.Future
+            self._capacity_waiters.append(waiter)
+            await waiter
+
+    def stats(self) -> dict:
+        return {
+            'running': self._running,
+            'depth': len(self._queue),
+            'submitted': self.submitted,
+            'completed': self.completed,
+            'dropped': self.dropped,
+        }
@@ -42,7 +42,7 @@ class States(UserDict):
                 raise ValueError('Expected instance of Field, got: {}'
                                  ''.format(state))
             if self._trigger_frame_handler:
-                frame = State(name, data={'value': value, 'last': state.value})
+                frame = State.unchecked(name, data={'value': value, 'last': state.value})
                 frame, handlers = self._handlers.match(frame)
                 for handler in handlers:
                     _should_update = self._trigger_frame_handler(
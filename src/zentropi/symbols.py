@@ -12,3 +12,10 @@ class KINDS(Enum):
     REQUEST = 4
     RESPONSE = 5
     STATE = 6
+
+
+KINDS_BY_VALUE = {kind.value: kind for kind in KINDS}  # type: dict
+
+# Both KINDS members and their int values map to the int value.
+KIND_VALUES = {kind: kind.value for kind in KINDS}  # type: dict
+KIND_VALUES.update({kind.value: kind.value for kind in KINDS})
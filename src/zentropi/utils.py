@@ -119,26 +119,23 @@ def validate_name(name):
 
 
 def validate_kind(kind):
-    from zentropi.symbols import KINDS
+    from zentropi.symbols import KINDS, KIND_VALUES, KINDS_BY_VALUE
 
     if kind is None:
         return KINDS.UNSET
-    if isinstance(kind, int):
-        return KINDS(kind)
-    if kind not in KINDS:
+    try:
+        return KINDS_BY_VALUE[KIND_VALUES[kind]]
+    except (KeyError, TypeError):
         raise ValueError('Expected kind to be one of zentropi.symbols.Kinds: {!r}. '
                          'Got: {!r}'.format(', '.join([str(k) for k in KINDS]), kind))
-    return kind
 
 
 def validate_data(data):
-    from zentropi.frames import FrameData
+    from zentropi.frames import EMPTY_FRAME_DATA, FrameData
 
     if not data:
-        return FrameData()  # type: ignore
-    assert isinstance(data, (dict, FrameData)), data
-    if isinstance(data, FrameData):
-        data = data.data
+        return EMPTY_FRAME_DATA
+    assert isinstance(data, dict), data
     assert len(json.dumps(data)) < FRAME_DATA_MAX_LENGTH
     return FrameData(data)  # type: ignore
 
@@ -122,6 +122,11 @@ class Zentropian(object):
                 'Async handlers are not supported '
                 'by the base Zentropian class. '
                 'Please use Agent.')
+        if handler.executor:
+            raise NotImplementedError(
+                'Handlers with executor={!r} are not supported '
+                'by the base Zentropian class. '
+                'Please use Agent.'.format(handler.executor))
         payload = []  # type: list
         if handler.pass_self:
             payload.append(self)
@@ -174,11 +179,12 @@ class Zentropian(object):
             self._connections.broadcast(frame=message)
         return message
 
-    def connect(self, endpoint, *, auth=None, tag='default'):
-        self._connections.connect(endpoint, auth=auth, tag=tag)
+    def connect(self, endpoint, *, auth=None, tag='default', **options):
+        """Extra options (e.g. codec='msgpack') are passed on to the connection class."""
+        self._connections.connect(endpoint, auth=auth, tag=tag, **options)
 
-    def bind(self, endpoint, *, tag='default'):
-        self._connections.bind(endpoint, tag=tag)
+    def bind(self, endpoint, *, tag='default', **options):
+        self._connections.bind(endpoint, tag=tag, **options)
 
     def join(self, space, *, tags: Optional[Union[list, str]] = None):
         self._connections.join(space, tags=tags)
@@ -0,0 +1,83 @@
+# coding=utf-8
+import asyncio
+import threading
+import time
+
+from zentropi import Agent
+
+
+def test_agent_stops_without_polling():
+    agent = Agent(name='test-agent')
+    agent.loop = asyncio.new_event_loop()
+    events = []
+
+    @agent.on_event('*** start')
+    def on_start(event):
+        events.append(event.name)
+        agent.stop()
+
+    @agent.on_event('*** stopped')
+    def on_stopped(event):
+        events.append(event.name)
+
+    started = time.monotonic()
+    agent.run()
+    assert time.monotonic() - started < 0.5
+    assert events == ['*** start', '*** stopped']
+    agent.loop.close()
+
+
+def test_agent_stop_from_thread():
+    agent = Agent(name='test-agent')
+    agent.loop = asyncio.new_event_loop()
+
+    @agent.on_event('*** start')
+    def on_start(event):
+        threading.Timer(0.05, agent.stop).start()
+
+    started = time.monotonic()
+    agent.run()
+    assert time.monotonic() - started < 0.5
+    agent.loop.close()
+
+
+
+def square_in_process(event):
+    return event.data.value ** 2
+
+
+def test_agent_handler_executors():
+    agent = Agent(name='test-agent', executor_threads=2, executor_processes=1)
+    agent.loop = asyncio.new_event_loop()
+    results = []
+    handle_return = agent.handle_return
+
+    def record_return(frame, return_value):
+        if frame.name in ('thread', 'square'):
+            results.append((frame.name, return_value))
+        return handle_return(frame, return_value)
+
+    agent.handle_return = record_return
+
+    @agent.on_event('thread', executor='thread')
+    def on_thread(event):
+        return threading.current_thread().name
+
+    agent.on_event('square', executor='process')(square_in_process)
+
+    @agent.on_event('*** start')
+    async def on_start(event):
+        agent.emit('thread')
+        agent.emit('square', data={'value': 7})
+        for _ in range(500):
+            if len(results) == 2:
+                break
+            await asyncio.sleep(0.01)
+        agent.stop()
+
+    agent.run()
+    agent.loop.close()
+    results = dict(results)
+    assert results['thread'].startswith('test-agent-handler')
+    assert results['square'] == 49
+    assert agent._executors == {}
@@ -0,0 +1,92 @@
+# coding=utf-8
+import pytest
+
+from zentropi.codecs import (
+    CODECS,
+    _INSTANCES,
+    Codec,
+    JsonCodec,
+    MsgpackCodec,
+    get_codec,
+    register_codec
+)
+from zentropi.frames import Event, Frame, Message
+
+
+def test_get_codec():
+    assert isinstance(get_codec(), JsonCodec)
+    assert get_codec('json') is get_codec(None)
+    codec = JsonCodec()
+    assert get_codec(codec) is codec
+
+
+@pytest.mark.xfail(raises=ValueError, strict=True)
+def test_get_codec_fails_on_unknown_codec():
+    get_codec('morse')
+
+
+@pytest.mark.xfail(raises=ValueError, strict=True)
+def test_register_codec_fails_on_invalid_codec():
+    register_codec(object)
+
+
+def test_register_codec():
+    class UpperJsonCodec(JsonCodec):
+        name = 'upper-json'
+
+    try:
+        register_codec(UpperJsonCodec)
+        assert isinstance(get_codec('upper-json'), UpperJsonCodec)
+        assert issubclass(UpperJsonCodec, Codec)
+    finally:
+        CODECS.pop('upper-json', None)
+        _INSTANCES.pop('upper-json', None)
+
+
+def test_json_codec():
+    event = Event('hello', data={'name': 'world'}, space='test-space')
+    payload = event.encode('json')
+    assert payload is event.as_json()
+    frame = Frame.decode(payload.encode('utf-8'), 'json', source='test-source')
+    assert isinstance(frame, Event)
+    assert frame.id == event.id
+    assert frame.data == {'name': 'world'}
+    assert frame.source == 'test-source'
+
+
+def test_msgpack_codec():
+    pytest.importorskip('msgpack')
+    event = Event('hello', data={'name': 'world'}, space='test-space', source='test-source')
+    payload = event.encode('msgpack')
+    assert isinstance(payload, bytes)
+    assert len(payload) < len(event.as_json())
+    assert event.encode('msgpack') is payload
+    frame = Frame.decode(payload, 'msgpack')
+    assert isinstance(frame, Event)
+    assert frame.as_dict() == event.as_dict()
+
+
+@pytest.mark.xfail(raises=ValueError, strict=True)
+def test_msgpack_codec_fails_on_str_payload():
+    pytest.importorskip('msgpack')
+    get_codec('msgpack').decode('not bytes')
+
+
+def test_msgpack_codec_custom_id_and_timestamp():
+    pytest.importorskip('msgpack')
+    message = Message('hello', id='not-hex', meta={'timestamp': 'just a string', 'extra': 1})
+    frame = get_codec('msgpack').decode(get_codec(MsgpackCodec()).encode(message))
+    assert isinstance(frame, Message)
+    assert frame.as_dict() == message.as_dict()
+
+
+@pytest.mark.parametrize('frame_id', [
+    '0123456789ABCDEF0123456789ABCDEF',
+    'aa bb cc dd ee ff 00 11 22 33 44',
+])
+def test_msgpack_codec_keeps_ids_that_are_not_canonical_hex(frame_id):
+    pytest.importorskip('msgpack')
+    event = Event('hello', id=frame_id)
+    frame = Frame.decode(event.encode('msgpack'), 'msgpack')
+    assert frame.id == frame_id
+    assert frame.as_dict() == event.as_dict()
@@ -0,0 +1,54 @@
+# coding=utf-8
+import time
+
+import pytest
+
+from zentropi import Agent
+from zentropi.dedup import FrameDeduplicator, RecentFrameIds
+
+
+def test_recent_frame_ids():
+    seen = RecentFrameIds(capacity=3, window=None)
+    for frame_id in ['a', 'b', 'c', 'd']:
+        assert frame_id not in seen
+        seen.add(frame_id)
+    assert len(seen) == 3
+    assert 'a' not in seen
+    assert 'd' in seen
+    assert seen.stats() == {'size': 3, 'hits': 1, 'misses': 5,
+                            'false_positives': 0, 'evictions': 1}
+
+
+def test_recent_frame_ids_window():
+    seen = RecentFrameIds(capacity=10, window=0.01)
+    seen.add('a')
+    assert 'a' in seen
+    time.sleep(0.02)
+    assert 'a' not in seen
+    seen.add('b')
+    assert len(seen) == 1
+
+
+@pytest.mark.xfail(raises=ValueError, strict=True)
+def test_recent_frame_ids_fails_on_zero_capacity():
+    RecentFrameIds(capacity=0)
+
+
+@pytest.mark.xfail(raises=NotImplementedError, strict=True)
+def test_frame_deduplicator():
+    _ = 'a' in FrameDeduplicator()
+
+
+def test_agent_dedup():
+    seen = RecentFrameIds(capacity=10)
+    agent = Agent(name='test-agent', dedup=seen)
+    calls = []
+
+    @agent.on_event('test-event')
+    def on_test(event):
+        calls.append(event)
+
+    event = agent.emit('test-event')
+    agent.handle_frame(event)
+    assert len(calls) == 1
+    assert seen.hits == 1
@@ -1,13 +1,19 @@
 # coding=utf-8
 import json
+import pickle
 import time
 import unittest
 
+import pytest
+
+from zentropi.defaults import FRAME_NAME_MAX_LENGTH
 from zentropi.frames import (
+    EMPTY_FRAME_DATA,
     Command,
     Event,
     Frame,
     FrameData,
+    FrozenFrameData,
     Message,
     Request,
     Response,
@@ -21,6 +27,22 @@ def test_frame_data():
     data.test = 'test'
     assert data.test == 'test'
     assert data.unknown is None
+    assert data == {'test': 'test'}
+    del data.test
+    assert data == {}
+    assert not hasattr(data, '__dict__')
+
+
+def test_frozen_frame_data():
+    data = FrozenFrameData({'a': 'b'})
+    assert data.a == 'b'
+    with pytest.raises(TypeError):
+        data.a = 'c'
+    with pytest.raises(TypeError):
+        data.update({'a': 'c'})
+    assert pickle.loads(pickle.dumps(data)) == {'a': 'b'}
+    assert Frame().data is EMPTY_FRAME_DATA
+    assert Frame().data is Event().data
 
 
 def test_frame_empty():
@@ -260,3 +282,83 @@ class TestZenceliumFrame(unittest.TestCase):
         frame = Frame.from_json(frame_as_json)
         assert frame.name == 'ohai'
         assert frame.data == {'name': 'geek'}
+
+
+def test_frame_unchecked():
+    event = Event.unchecked('sensor', data={'value': 1}, source='test-source', space='test-space')
+    assert isinstance(event, Event)
+    assert event.kind == KINDS.EVENT
+    assert event.id
+    assert event.data == {'value': 1}
+    assert event.source == 'test-source'
+    assert event.space == 'test-space'
+    assert event.timestamp is not None
+    assert event._checked is False
+    assert event.as_dict()['name'] == 'sensor'
+    assert event._checked is True
+    message = Message.unchecked('hello')
+    assert message.text == 'hello'
+    frame = Frame.from_dict({'name': 'ohai', 'kind': KINDS.STATE.value}, trusted=True)
+    assert isinstance(frame, State)
+
+
+@pytest.mark.xfail(raises=AssertionError, strict=True)
+def test_frame_unchecked_size_checked_on_serialization():
+    event = Event.unchecked('too-big', data={'x': 'X' * 1024 * 1024})
+    event.as_json()
+
+
+@pytest.mark.xfail(raises=ValueError, strict=True)
+def test_frame_unchecked_name_checked_on_serialization():
+    Frame.from_dict({'name': 'x' * 500, 'kind': KINDS.EVENT.value}, trusted=True).as_json()
+
+
+def test_message_unchecked_truncates_name():
+    text = 'x' * 500
+    message = Message.unchecked(text)
+    assert message.name == Message(text).name == text[:FRAME_NAME_MAX_LENGTH]
+    assert message.text == text
+    assert message.as_dict()['name'] == text[:FRAME_NAME_MAX_LENGTH]
+
+
+def test_frame_as_json_cached():
+    frame = Event('hello', data={'name': 'world'})
+    frame_as_json = frame.as_json()
+    assert frame.as_json() is frame_as_json
+    frame.space = 'test-space'
+    assert json.loads(frame.as_json())['meta']['space'] == 'test-space'
+    frame.data = {'name': 'again'}
+    assert json.loads(frame.as_json())['data'] == {'name': 'again'}
+    frame.name = 'bye'
+    frame.target = 'test-target'
+    frame.reply_to = 'test-reply-to'
+    frame_as_dict = json.loads(frame.as_json())
+    assert frame_as_dict['name'] == 'bye'
+    assert frame_as_dict['meta']['target'] == 'test-target'
+    assert frame_as_dict['meta']['reply_to'] == 'test-reply-to'
+
+
+def test_frame_cannot_go_stale_after_encoding():
+    frame = Event('hello', data={'name': 'world'})
+    frame.data.name = 'before'
+    frame.as_json()
+    with pytest.raises(TypeError):
+        frame.data['name'] = 'after'
+    with pytest.raises(TypeError):
+        frame.meta['space'] = 'test-space'
+    assert json.loads(frame.as_json())['data'] == {'name': 'before'}
+    frame.data = dict(frame.data, name='after')
+    assert json.loads(frame.as_json())['data'] == {'name': 'after'}
+
+
+def test_frame_build_kinds():
+    for kind, frame_class in [(KINDS.COMMAND, Command), (KINDS.EVENT, Event),
+                              (KINDS.MESSAGE, Message), (KINDS.REQUEST, Request),
+                              (KINDS.RESPONSE, Response), (KINDS.STATE, State)]:
+        assert type(Frame.build('test', kind=kind)) is frame_class
+        frame = Frame.build('test', kind=kind.value)
+        assert type(frame) is frame_class
+        assert frame.kind is kind
+        assert frame.as_dict()['kind'] == kind.value
+        assert type(Frame.from_json(frame.as_json(), trusted=True)) is frame_class
+    assert type(Frame.build('test', kind=KINDS.UNSET)) is Frame
@@ -4,7 +4,9 @@ import pytest
 from zentropi.frames import Event
 from zentropi.handlers import (
     Handler,
+    FuzzyIndex,
     HandlerRegistry,
+    ParseIndex,
     validate_handler,
     validate_kind,
     validate_name
@@ -179,3 +181,91 @@ def test_handler_describe():
     assert description['kind'] == KINDS.EVENT.name
     assert description['match'] == 'exact'
     assert description['help'] == "A dummy handler."
+
+
+def test_handler_registry_ignore_case():
+    handler = Handler(KINDS.EVENT, 'dummy', handler=dummy, ignore_case=True)
+    handler_case = Handler(KINDS.EVENT, 'dummy', handler=dummy)
+    registry = HandlerRegistry()
+    registry.add_handler('Test-Event', handler)
+    registry.add_handler('test-event', handler_case)
+    frame_, handlers_ = registry.match(frame=Event('test-event'))
+    assert handlers_ == {handler, handler_case}
+    frame_1, handlers_1 = registry.match(frame=Event('TEST-EVENT'))
+    assert handlers_1 == {handler}
+    registry.remove_handler('Test-Event', handler)
+    frame_2, handlers_2 = registry.match(frame=Event('TEST-EVENT'))
+    assert handlers_2 == set()
+
+
+def test_handler_registry_catch_all():
+    handler = Handler(KINDS.EVENT, 'dummy', handler=dummy)
+    handler_all = Handler(KINDS.EVENT, '*', handler=dummy)
+    registry = HandlerRegistry()
+    registry.add_handler('test-event', handler)
+    registry.add_handler('*', handler_all)
+    frame_, handlers_ = registry.match(frame=Event('test-event'))
+    assert handlers_ == {handler}
+    frame_1, handlers_1 = registry.match(frame=Event('something else'))
+    assert handlers_1 == {handler_all}
+    registry.remove_handler('*', handler_all)
+    frame_2, handlers_2 = registry.match(frame=Event('something else'))
+    assert handlers_2 == set()
+
+
+def test_parse_index():
+    index = ParseIndex()
+    index.add('turn {state} the {device}')
+    index.add('turn on the {device}')
+    index.add('{anything}')
+    assert len(index) == 3
+    assert ParseIndex.literal_prefix('Turn {{on}} {x}') == 'turn {on} '
+    assert index.candidates('turn on the lights') == [
+        'turn {state} the {device}', 'turn on the {device}', '{anything}']
+    assert index.candidates('hello') == ['{anything}']
+    pattern, result = index.match('Turn ON the lights')
+    assert pattern == 'turn {state} the {device}'
+    assert result.named == {'state': 'ON', 'device': 'lights'}
+    index.add('turn on the {device}')
+    index.remove('turn on the {device}')
+    assert 'turn on the {device}' in index
+    index.remove('turn on the {device}')
+    index.remove('turn {state} the {device}')
+    assert index.candidates('turn on the lights') == ['{anything}']
+
+
+def test_fuzzy_index():
+    index = FuzzyIndex(threshold=70, cache_size=2)
+    index.add('turn on the lights')
+    index.add('play some music')
+    assert FuzzyIndex.normalize('The  Lights, on!') == 'lights on the'
+    assert index.match('lights on the turn') == ('turn on the lights', 100)
+    assert index.match('turn on lights')[0] == 'turn on the lights'
+    assert index.match('what time is it') is None
+    assert len(index._cache) == 2
+    index.remove('turn on the lights')
+    assert not index._cache
+    assert index.match('lights on the turn') is None
+
+
+def test_handler_executor():
+    handler = Handler(kind=KINDS.EVENT, name='test', handler=lambda e: None, executor='thread')
+    assert handler.executor == 'thread'
+    assert Handler(kind=KINDS.EVENT, name='test', handler=lambda e: None).executor is None
+
+
+@pytest.mark.xfail(raises=ValueError, strict=True)
+def test_handler_executor_fails_on_unknown_executor():
+    Handler(kind=KINDS.EVENT, name='test', handler=lambda e: None, executor='fiber')
+
+
+@pytest.mark.xfail(raises=ValueError, strict=True)
+def test_handler_executor_fails_on_coroutine():
+    async def handler(event):
+        pass
+    Handler(kind=KINDS.EVENT, name='test', handler=handler, executor='thread')
+
+
+@pytest.mark.xfail(raises=ValueError, strict=True)
+def test_handler_executor_fails_on_state():
+    Handler(kind=KINDS.STATE, name='test', handler=lambda s: True, executor='thread')
@@ -0,0 +1,49 @@
+# coding=utf-8
+import time
+
+import pytest
+
+from zentropi import ids
+from zentropi.frames import Frame
+
+
+def test_monotonic_ids():
+    generate = ids.MonotonicIdGenerator(node=0x1234abcd)
+    generated = [generate() for _ in range(1000)]
+    assert generated == sorted(generated)
+    assert len(set(generated)) == 1000
+    assert all(len(i) == 32 for i in generated)
+    assert all(i[12] == '7' and i[16] in '89ab' for i in generated)
+    assert len({i[13:16] + i[17:22] for i in generated}) == 1
+    assert generate.node == '1234abcd'
+    assert abs(ids.id_timestamp(generated[0]) - time.time()) < 5
+
+
+def test_id_bytes():
+    frame_id = ids.new_id()
+    assert len(ids.id_to_bytes(frame_id)) == ids.ID_BYTES
+    assert ids.id_from_bytes(ids.id_to_bytes(frame_id)) == frame_id
+    assert ids.id_to_bytes('not-hex') is None
+    assert ids.id_to_bytes('x' * 32) is None
+    assert ids.id_to_bytes(frame_id.upper()) is None
+    assert ids.id_to_bytes('aa bb cc dd ee ff 00 11 22 33 44') is None
+    assert ids.id_timestamp('not-hex') is None
+    assert ids.id_timestamp(ids.random_id()) is None
+
+
+def test_set_id_generator():
+    generator = ids.get_id_generator()
+    try:
+        ids.set_id_generator(lambda: 'fixed-id')
+        assert Frame().id == 'fixed-id'
+        ids.set_id_generator(ids.random_id)
+        assert len(Frame().id) == 32
+    finally:
+        ids.set_id_generator(generator)
+    first, second = Frame(), Frame()
+    assert first.id < second.id
+
+
+@pytest.mark.xfail(raises=ValueError, strict=True)
+def test_set_id_generator_fails_on_invalid_generator():
+    ids.set_id_generator('not callable')
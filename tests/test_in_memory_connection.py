@@ -36,3 +36,9 @@ def test_inmemory():
     server = DummyServer(name='dummy-server')
     client1 = DummyClient(name='dummy-client')
     client1.emit('*** started')
+
+
+def test_inmemory_accepts_codec():
+    agent = Zentropian(name='test-agent')
+    agent.bind('inmemory://test-codec', codec='msgpack')
+    assert agent._connections.connected
@@ -0,0 +1,143 @@
+# coding=utf-8
+import asyncio
+
+import pytest
+
+from zentropi import Agent
+from zentropi.pool import HandlerPool
+
+
+def run_pool(pool, jobs):
+    loop = asyncio.new_event_loop()
+    pool.bind(loop.create_task)
+
+    async def main():
+        for job in jobs:
+            pool.submit(job)
+        while pool.running or pool.depth:
+            await asyncio.sleep(0.001)
+
+    loop.run_until_complete(main())
+    loop.close()
+
+
+def make_jobs(count, done, active):
+    def make_job(n):
+        async def job():
+            active.append(n)
+            assert len(active) <= 2
+            await asyncio.sleep(0.001)
+            active.remove(n)
+            done.append(n)
+        return job
+    return [make_job(n) for n in range(count)]
+
+
+def test_handler_pool_limits_concurrency():
+    done, active = [], []
+    pool = HandlerPool(concurrency=2, queue_size=10)
+    run_pool(pool, make_jobs(8, done, active))
+    assert sorted(done) == list(range(8))
+    assert pool.stats() == {'running': 0, 'depth': 0, 'submitted': 8,
+                            'completed': 8, 'dropped': 0}
+
+
+def test_handler_pool_drop_newest():
+    done, active = [], []
+    pool = HandlerPool(concurrency=2, queue_size=2, overflow='drop-newest')
+    run_pool(pool, make_jobs(8, done, active))
+    assert done == [0, 1, 2, 3]
+    assert pool.dropped == 4
+
+
+def test_handler_pool_drop_oldest():
+    done, active = [], []
+    pool = HandlerPool(concurrency=2, queue_size=2, overflow='drop-oldest')
+    run_pool(pool, make_jobs(8, done, active))
+    assert done == [0, 1, 6, 7]
+    assert pool.dropped == 4
+
+
+def test_handler_pool_block():
+    done, active = [], []
+    pool = HandlerPool(concurrency=2, queue_size=2, overflow='block')
+    loop = asyncio.new_event_loop()
+    pool.bind(loop.create_task)
+
+    async def reader():
+        for job in make_jobs(8, done, active):
+            await pool.wait_for_capacity()
+            assert pool.depth <= 2
+            pool.submit(job)
+        while pool.running or pool.depth:
+            await asyncio.sleep(0.001)
+
+    loop.run_until_complete(reader())
+    loop.close()
+    assert sorted(done) == list(range(8))
+    assert pool.dropped == 0
+
+
+def test_handler_pool_block_is_bounded_for_sync_producers():
+    done, active = [], []
+    pool = HandlerPool(concurrency=2, queue_size=2, overflow='block')
+    run_pool(pool, make_jobs(8, done, active))
+    assert done == [0, 1, 2, 3]
+    assert pool.dropped == 4
+
+
+def test_handler_pool_drop_does_not_block_readers():
+    done, active = [], []
+    pool = HandlerPool(concurrency=1, queue_size=2, overflow='drop-newest')
+    loop = asyncio.new_event_loop()
+    pool.bind(loop.create_task)
+
+    async def reader():
+        for job in make_jobs(10, done, active):
+            await pool.wait_for_capacity()
+            pool.submit(job)
+        while pool.running or pool.depth:
+            await asyncio.sleep(0.001)
+
+    loop.run_until_complete(reader())
+    loop.close()
+    assert done == [0, 1, 2]
+    assert pool.dropped == 7
+
+
+@pytest.mark.xfail(raises=ValueError, strict=True)
+def test_handler_pool_fails_on_unknown_overflow():
+    HandlerPool(overflow='explode')
+
+
+@pytest.mark.xfail(raises=AssertionError, strict=True)
+def test_handler_pool_fails_when_unbound():
+    HandlerPool().submit(lambda: None)
+
+
+def test_agent_has_no_handler_pool_by_default():
+    assert Agent(name='test-agent').handler_pool is None
+
+
+def test_agent_handler_pool():
+    agent = Agent(name='test-agent', handler_pool=HandlerPool(concurrency=1))
+    agent.loop = asyncio.new_event_loop()
+    calls = []
+
+    @agent.on_event('test-event')
+    async def on_test(event):
+        calls.append(event.name)
+        await asyncio.sleep(0.001)
+        if len(calls) == 3:
+            agent.stop()
+
+    @agent.on_event('*** start')
+    def on_start(event):
+        for _ in range(3):
+            agent.emit('test-event')
+        assert agent.handler_pool.running == 1
+        assert agent.handler_pool.depth == 2
+
+    agent.run()
+    assert calls == ['test-event'] * 3
+    agent.loop.close()
@@ -1,6 +1,6 @@
 # coding=utf-8
 
-from zentropi.symbols import KINDS
+from zentropi.symbols import KIND_VALUES, KINDS, KINDS_BY_VALUE
 
 
 def test_kind():
@@ -12,3 +12,10 @@ def test_kind():
     assert KINDS.REQUEST.value == 4
     assert KINDS.RESPONSE.value == 5
     assert KINDS.STATE.value == 6
+
+
+def test_kind_lookups():
+    for kind in KINDS:
+        assert KINDS_BY_VALUE[kind.value] is kind
+        assert KIND_VALUES[kind] == kind.value
+        assert KIND_VALUES[kind.value] == kind.value